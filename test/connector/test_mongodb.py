@@ -0,0 +1,140 @@
+import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from unstructured_ingest.connector.mongodb import (
+    MongoDBAccessConfig,
+    MongoDBDestinationConnector,
+    MongoDBIngestDocBatch,
+    MongoDBWriteConfig,
+    SimpleMongoDBConfig,
+    concat_leaf_values,
+)
+from unstructured_ingest.interfaces import ProcessorConfig, ReadConfig
+from unstructured_ingest.utils.data_prep import flatten_dict
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        {},
+        {"title": "a", "body": ""},
+        {"a": {"b": {"c": 1}, "d": [1, {"e": 2}]}, "f": None, "g": {}, "h": "text"},
+        {"created": datetime.datetime(2024, 1, 1), "nested": {"empty": "", "value": 1.5}},
+    ],
+)
+def test_concat_leaf_values_matches_flattened_values(document):
+    flattened_values = [str(value) for value in flatten_dict(dictionary=document).values()]
+    assert concat_leaf_values(document) == "\n".join(flattened_values).encode("utf8")
+
+
+@pytest.fixture()
+def destination_connector():
+    pytest.importorskip("pymongo")
+    connector = MongoDBDestinationConnector(
+        write_config=MongoDBWriteConfig(batch_size=2),
+        connector_config=SimpleMongoDBConfig(
+            access_config=MongoDBAccessConfig(uri="mongodb://localhost:27017"),
+            database="db",
+            collection="collection",
+        ),
+    )
+    connector._client = MagicMock()
+    connector.connector_config.get_collection = MagicMock()
+    return connector
+
+
+@pytest.mark.parametrize(
+    ("pymongo_version", "server_version", "expected"),
+    [((4, 9, 0), [8, 0, 0], True), ((4, 8, 0), [8, 0, 0], False), ((4, 9, 0), [7, 0, 9], False)],
+)
+def test_client_bulk_write_support(
+    mocker, destination_connector, pymongo_version, server_version, expected
+):
+    mocker.patch("pymongo.version_tuple", pymongo_version)
+    destination_connector.client.server_info.return_value = {"versionArray": server_version}
+    assert destination_connector.client_bulk_write is expected
+    # The check is only made once per connector
+    assert destination_connector.client_bulk_write is expected
+    assert destination_connector.client.server_info.call_count <= 1
+
+
+def test_write_dict_client_bulk_write(mocker, destination_connector):
+    mock_insert_one = mocker.patch("pymongo.InsertOne")
+    destination_connector._client_bulk_write = True
+    collection = destination_connector.connector_config.get_collection.return_value
+    collection.full_name = "db.collection"
+    elements = [{"text": str(i)} for i in range(3)]
+
+    destination_connector.write_dict(elements_dict=elements)
+
+    client = destination_connector.client
+    assert [call.kwargs["ordered"] for call in client.bulk_write.call_args_list] == [False, False]
+    assert [len(call.args[0]) for call in client.bulk_write.call_args_list] == [2, 1]
+    assert [call.args[0] for call in mock_insert_one.call_args_list] == elements
+    assert {call.kwargs["namespace"] for call in mock_insert_one.call_args_list} == {
+        "db.collection"
+    }
+    collection.insert_many.assert_not_called()
+
+
+def test_write_dict_insert_many(destination_connector):
+    destination_connector._client_bulk_write = False
+    collection = destination_connector.connector_config.get_collection.return_value
+    elements = [{"text": str(i)} for i in range(3)]
+
+    destination_connector.write_dict(elements_dict=elements)
+
+    assert [list(call.args[0]) for call in collection.insert_many.call_args_list] == [
+        elements[:2],
+        elements[2:],
+    ]
+    assert all(not call.kwargs["ordered"] for call in collection.insert_many.call_args_list)
+    destination_connector.client.bulk_write.assert_not_called()
+
+
+@pytest.mark.parametrize("projection", [{"_id": 0}, {"_id": False, "title": 1}])
+def test_projection_excluding_id_rejected(projection):
+    with pytest.raises(ValueError, match="_id"):
+        SimpleMongoDBConfig(access_config=MongoDBAccessConfig(), projection=projection)
+
+
+@pytest.mark.parametrize("projection", [[1], "x", 1])
+def test_projection_not_an_object_rejected(projection):
+    with pytest.raises(ValueError, match="json object"):
+        SimpleMongoDBConfig(access_config=MongoDBAccessConfig(), projection=projection)
+
+
+@pytest.mark.parametrize("projection", [None, {"title": 1}, {"body": 0}, {"_id": 1, "title": 1}])
+def test_projection_keeping_id_accepted(projection):
+    config = SimpleMongoDBConfig(access_config=MongoDBAccessConfig(), projection=projection)
+    assert config.projection == projection
+
+
+def test_get_files_does_not_keep_documents(mocker, tmp_path):
+    bson_objectid = pytest.importorskip("bson.objectid")
+    ids = [bson_objectid.ObjectId() for _ in range(2)]
+    batch = MongoDBIngestDocBatch(
+        processor_config=ProcessorConfig(),
+        read_config=ReadConfig(download_dir=str(tmp_path)),
+        connector_config=SimpleMongoDBConfig(
+            access_config=MongoDBAccessConfig(), collection="collection"
+        ),
+        list_of_ids=[str(i) for i in ids],
+    )
+    documents = MagicMock()
+    documents.__enter__.return_value = iter(
+        [{"_id": _id, "title": f"title {i}", "body": {"text": "body"}} for i, _id in enumerate(ids)]
+    )
+    mocker.patch.object(MongoDBIngestDocBatch, "_get_docs", return_value=documents)
+
+    batch.get_files()
+
+    assert [doc.document for doc in batch.ingest_docs] == [{}, {}]
+    assert [doc.filename.read_text() for doc in batch.ingest_docs] == [
+        "title 0\nbody",
+        "title 1\nbody",
+    ]
+    assert all(doc.source_metadata.exists for doc in batch.ingest_docs)
+    documents.__exit__.assert_called_once()
@@ -8,6 +8,7 @@ import pytz
 
 from unstructured_ingest.cli.utils import extract_config
 from unstructured_ingest.interfaces import BaseConfig
+from unstructured_ingest.utils.data_prep import flatten_dict
 from unstructured_ingest.utils.string_and_date_utils import ensure_isoformat_datetime, json_to_dict
 
 
@@ -162,3 +163,27 @@ def test_ensure_isoformat_datetime_fails_on_string():
 def test_ensure_isoformat_datetime_fails_on_int():
     with pytest.raises(TypeError):
         ensure_isoformat_datetime(1111)
+
+
+def test_flatten_dict():
+    dictionary = {"a": {"b": 1, "c": {"d": None}}, "e": [1, {"f": 2}], "g": None}
+    assert flatten_dict(dictionary) == {"a_b": 1, "a_c_d": None, "e": [1, {"f": 2}], "g": None}
+
+
+def test_flatten_dict_flatten_lists_and_remove_none():
+    dictionary = {"a": {"b": 1, "c": {"d": None}}, "e": [1, {"f": 2}, None], "g": None}
+    assert flatten_dict(dictionary, separator="-", flatten_lists=True, remove_none=True) == {
+        "a-b": 1,
+        "e-0": 1,
+        "e-1-f": 2,
+    }
+
+
+def test_flatten_dict_keys_to_omit():
+    dictionary = {"a": {"b": {"c": 1}, "d": 2}, "e": [1, 2]}
+    assert flatten_dict(dictionary, flatten_lists=True, keys_to_omit=["a_b", "e_1"]) == {
+        "a_b": {"c": 1},
+        "a_d": 2,
+        "e_0": 1,
+        "e_1": 2,
+    }
@@ -0,0 +1,208 @@
+import copy
+import json
+import threading
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from unstructured_ingest.error import DestinationConnectionError
+from unstructured_ingest.v2.interfaces import FileData, UploadContent
+from unstructured_ingest.v2.processes.connectors.chroma import (
+    BULK_INGEST_SQLITE_PRAGMAS,
+    ChromaAccessConfig,
+    ChromaConnectionConfig,
+    ChromaUploader,
+    ChromaUploaderConfig,
+    ChromaUploadStager,
+)
+
+
+@pytest.mark.parametrize(
+    ("element", "expected"),
+    [
+        pytest.param(
+            {"element_id": "e1", "text": "hello", "embeddings": [0.1, 0.2], "page_number": 1},
+            {
+                "id": "e1",
+                "embedding": [0.1, 0.2],
+                "document": "hello",
+                "metadata": {"element_id": "e1", "page_number": 1},
+            },
+            id="flat",
+        ),
+        pytest.param(
+            {
+                "element_id": "e2",
+                "text": "hello",
+                "embeddings": None,
+                "type": None,
+                "metadata": {
+                    "filename": "a.pdf",
+                    "data_source": {"url": "s3://bucket/a.pdf", "version": None},
+                    "languages": ["eng", "fra"],
+                },
+            },
+            {
+                "id": "e2",
+                "embedding": None,
+                "document": "hello",
+                "metadata": {
+                    "element_id": "e2",
+                    "metadata-filename": "a.pdf",
+                    "metadata-data_source-url": "s3://bucket/a.pdf",
+                    "metadata-languages-0": "eng",
+                    "metadata-languages-1": "fra",
+                },
+            },
+            id="nested-without-none",
+        ),
+        pytest.param(
+            {"element_id": "e3", "metadata": {"coordinates": {"points": ((1, 2), (3, 4))}}},
+            {
+                "id": "e3",
+                "embedding": None,
+                "document": None,
+                "metadata": {
+                    "element_id": "e3",
+                    "metadata-coordinates-points-0-0": 1,
+                    "metadata-coordinates-points-0-1": 2,
+                    "metadata-coordinates-points-1-0": 3,
+                    "metadata-coordinates-points-1-1": 4,
+                },
+            },
+            id="tuples",
+        ),
+    ],
+)
+def test_conform_dict(element, expected):
+    original = copy.deepcopy(element)
+    assert ChromaUploadStager.conform_dict(data=element) == expected
+    assert element == original
+
+
+def test_conform_dict_without_element_id():
+    element = {"text": "hello", "type": "Text"}
+    conformed = ChromaUploadStager.conform_dict(data=element)
+    assert uuid.UUID(conformed["id"])
+    assert conformed["document"] == "hello"
+    assert conformed["metadata"] == {"type": "Text"}
+    assert element == {"text": "hello", "type": "Text"}
+
+
+def test_stager_run_removes_partial_output_on_failure(mocker, tmp_path):
+    elements_filepath = tmp_path / "elements.json"
+    elements_filepath.write_text(json.dumps([{"text": "a"}, {"text": "b"}]))
+    stager = ChromaUploadStager()
+    mocker.patch.object(
+        stager, "conform_dict", side_effect=[{"id": "a"}, ValueError("bad element")]
+    )
+
+    with pytest.raises(ValueError, match="bad element"):
+        stager.run(
+            elements_filepath=elements_filepath,
+            file_data=None,
+            output_dir=tmp_path,
+            output_filename="staged",
+        )
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["elements.json"]
+
+
+class FakeConnection:
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, sql):
+        self.executed.append(sql)
+
+
+class FakePerThreadPool:
+    """Hands out one connection per thread, like chromadb's PerThreadPool"""
+
+    def __init__(self):
+        self.local = threading.local()
+        self.connections = {}
+        self.lock = threading.Lock()
+
+    def connect(self):
+        if not hasattr(self.local, "conn"):
+            self.local.conn = FakeConnection()
+            with self.lock:
+                self.connections[threading.get_ident()] = self.local.conn
+        return self.local.conn
+
+    def return_to_pool(self, conn):
+        pass
+
+
+class FakeCollection:
+    def __init__(self, pool):
+        self.pool = pool
+        self.upsert_threads = set()
+        self.upserted_ids = []
+
+    def upsert(self, ids, **kwargs):
+        # Every upsert should run on a connection that already has the pragmas applied
+        assert self.pool.connect().executed == list(BULK_INGEST_SQLITE_PRAGMAS)
+        self.upsert_threads.add(threading.get_ident())
+        self.upserted_ids.extend(ids)
+
+
+def get_persistent_uploader(client) -> ChromaUploader:
+    uploader = ChromaUploader(
+        upload_config=ChromaUploaderConfig(batch_size=1, num_threads=2, bulk_ingest=True),
+        connection_config=ChromaConnectionConfig(
+            collection_name="collection", access_config=ChromaAccessConfig(), path="/tmp/chroma"
+        ),
+    )
+    uploader._client = client
+    return uploader
+
+
+def write_staged_elements(path: Path, count: int) -> Path:
+    path.write_text(
+        json.dumps(
+            [
+                {"id": str(i), "embedding": None, "document": "text", "metadata": {}}
+                for i in range(count)
+            ]
+        )
+    )
+    return path
+
+
+def test_bulk_ingest_applies_pragmas_on_each_upload_thread(tmp_path):
+    pool = FakePerThreadPool()
+    collection = FakeCollection(pool)
+    client = SimpleNamespace(
+        _server=SimpleNamespace(_sysdb=SimpleNamespace(_conn_pool=pool)),
+        get_or_create_collection=lambda name: collection,
+    )
+    staged_path = write_staged_elements(tmp_path / "staged.json", count=10)
+    file_data = FileData(identifier="mock file data", connector_type="local")
+
+    get_persistent_uploader(client).run(
+        contents=[UploadContent(path=staged_path, file_data=file_data)]
+    )
+
+    assert sorted(collection.upserted_ids, key=int) == [str(i) for i in range(10)]
+    assert collection.upsert_threads
+    assert threading.get_ident() not in collection.upsert_threads
+    # Only the upload threads' own connections were changed
+    assert set(pool.connections) == collection.upsert_threads
+    assert all(
+        conn.executed == list(BULK_INGEST_SQLITE_PRAGMAS) for conn in pool.connections.values()
+    )
+
+
+def test_bulk_ingest_unsupported_client(tmp_path):
+    client = SimpleNamespace(get_or_create_collection=lambda name: None)
+    staged_path = write_staged_elements(tmp_path / "staged.json", count=1)
+    file_data = FileData(identifier="mock file data", connector_type="local")
+
+    with pytest.raises(DestinationConnectionError, match="bulk ingest is not supported"):
+        get_persistent_uploader(client).run(
+            contents=[UploadContent(path=staged_path, file_data=file_data)]
+        )
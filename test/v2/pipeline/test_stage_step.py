@@ -0,0 +1,88 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from unstructured_ingest.v2.interfaces import FileData, ProcessorConfig
+from unstructured_ingest.v2.pipeline.steps.stage import UploadStageStep
+from unstructured_ingest.v2.processes.connectors.chroma import ChromaUploadStager
+
+
+@pytest.fixture()
+def elements_filepath(tmp_path: Path) -> Path:
+    elements_filepath = tmp_path / "elements.json"
+    elements_filepath.write_text("[]")
+    os.utime(elements_filepath, (1000, 1000))
+    return elements_filepath
+
+
+def get_step(tmp_path: Path, reprocess: bool = False) -> UploadStageStep:
+    return UploadStageStep(
+        process=ChromaUploadStager(),
+        context=ProcessorConfig(work_dir=str(tmp_path / "work"), reprocess=reprocess),
+    )
+
+
+def get_output_path(tmp_path: Path, mtime: int) -> Path:
+    output_path = tmp_path / "staged.json"
+    output_path.write_text("[]")
+    os.utime(output_path, (mtime, mtime))
+    return output_path
+
+
+def get_file_data(reprocess: bool = False) -> FileData:
+    return FileData(identifier="mock file data", connector_type="local", reprocess=reprocess)
+
+
+def test_should_stage_newer_output_skipped(tmp_path, elements_filepath):
+    assert not get_step(tmp_path).should_stage(
+        elements_filepath=elements_filepath,
+        output_path=get_output_path(tmp_path, mtime=2000),
+        file_data=get_file_data(),
+    )
+
+
+def test_should_stage_same_mtime_output_skipped(tmp_path, elements_filepath):
+    assert not get_step(tmp_path).should_stage(
+        elements_filepath=elements_filepath,
+        output_path=get_output_path(tmp_path, mtime=1000),
+        file_data=get_file_data(),
+    )
+
+
+def test_should_stage_older_output(tmp_path, elements_filepath):
+    assert get_step(tmp_path).should_stage(
+        elements_filepath=elements_filepath,
+        output_path=get_output_path(tmp_path, mtime=500),
+        file_data=get_file_data(),
+    )
+
+
+def test_should_stage_missing_output(tmp_path, elements_filepath):
+    assert get_step(tmp_path).should_stage(
+        elements_filepath=elements_filepath,
+        output_path=tmp_path / "missing.json",
+        file_data=get_file_data(),
+    )
+
+
+def test_should_stage_unknown_output_path(tmp_path, elements_filepath):
+    assert get_step(tmp_path).should_stage(
+        elements_filepath=elements_filepath, output_path=None, file_data=get_file_data()
+    )
+
+
+def test_should_stage_context_reprocess(tmp_path, elements_filepath):
+    assert get_step(tmp_path, reprocess=True).should_stage(
+        elements_filepath=elements_filepath,
+        output_path=get_output_path(tmp_path, mtime=2000),
+        file_data=get_file_data(),
+    )
+
+
+def test_should_stage_file_data_reprocess(tmp_path, elements_filepath):
+    assert get_step(tmp_path).should_stage(
+        elements_filepath=elements_filepath,
+        output_path=get_output_path(tmp_path, mtime=2000),
+        file_data=get_file_data(reprocess=True),
+    )
@@ -0,0 +1,59 @@
+import pytest
+
+from unstructured_ingest.v2.interfaces import file_data as file_data_module
+from unstructured_ingest.v2.interfaces.file_data import (
+    FileData,
+    FileDataSourceMetadata,
+    SourceIdentifiers,
+)
+
+
+def get_file_data() -> FileData:
+    return FileData(
+        identifier="mock file data",
+        connector_type="local",
+        source_identifiers=SourceIdentifiers(
+            filename="file.pdf", fullpath="dir/file.pdf", rel_path="file.pdf"
+        ),
+        metadata=FileDataSourceMetadata(
+            url="s3://bucket/dir/file.pdf",
+            version="1",
+            record_locator={"bucket": "bucket", "key": {"path": "dir/file.pdf"}},
+            date_modified="1700000000.0",
+            permissions_data=[{"mode": 33188}],
+            filesize_bytes=1024,
+        ),
+        additional_metadata={"nested": {"list": [1, 2.5, None, "a"], "flag": True}, "é": "ü"},
+        reprocess=True,
+    )
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(file_data_module, "orjson", None)
+    return request.param
+
+
+def test_file_data_round_trip(tmp_path, json_backend):
+    file_data = get_file_data()
+    path = tmp_path / "file_data.json"
+    file_data.to_file(path=str(path))
+    assert FileData.from_file(path=str(path)) == file_data
+
+
+def test_file_data_backends_write_the_same_json(tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    file_data = get_file_data()
+    orjson_path = tmp_path / "orjson.json"
+    file_data.to_file(path=str(orjson_path))
+    monkeypatch.setattr(file_data_module, "orjson", None)
+    json_path = tmp_path / "json.json"
+    file_data.to_file(path=str(json_path))
+
+    # Files written by either backend are read back the same way by the other
+    assert FileData.from_file(path=str(orjson_path)) == file_data
+    monkeypatch.undo()
+    assert FileData.from_file(path=str(json_path)) == file_data
@@ -1 +1 @@
-__version__ = "0.0.2"  # pragma: no cover
+__version__ = "0.0.3-dev0"  # pragma: no cover
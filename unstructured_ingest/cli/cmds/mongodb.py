@@ -4,9 +4,8 @@ from dataclasses import dataclass
 import click
 
 from unstructured_ingest.cli.base.src import BaseSrcCmd
-from unstructured_ingest.cli.interfaces import CliConfig, DelimitedString
-from unstructured_ingest.connector.mongodb import SimpleMongoDBConfig
-from unstructured_ingest.interfaces import WriteConfig
+from unstructured_ingest.cli.interfaces import CliConfig, DelimitedString, Dict
+from unstructured_ingest.connector.mongodb import MongoDBWriteConfig, SimpleMongoDBConfig
 
 CMD_NAME = "mongodb"
 
@@ -33,6 +32,13 @@ class MongoDBCliConfig(SimpleMongoDBConfig, CliConfig):
             click.Option(
                 ["--collection"], required=True, type=str, help="collection name to connect to"
             ),
+            click.Option(
+                ["--write-concern"],
+                type=int,
+                default=None,
+                help="write concern (w) to use for the client, 0 disables write acknowledgement "
+                "for faster inserts at the cost of durability",
+            ),
         ]
         return options
 
@@ -45,9 +51,31 @@ class MongoDBReadConfig(SimpleMongoDBConfig, CliConfig):
             click.Option(
                 ["--batch-size"],
                 default=100,
-                type=click.IntRange(0),
+                type=click.IntRange(1),
                 help="how many records to read at a time per process",
             ),
+            click.Option(
+                ["--projection"],
+                required=False,
+                type=Dict(),
+                help="Projection of the fields to fetch for each document, _id can't be "
+                'excluded. example: \'{"title": 1, "body": 1}\' ',
+            ),
+        ]
+        return options
+
+
+@dataclass
+class MongoDBCliWriteConfig(MongoDBWriteConfig, CliConfig):
+    @staticmethod
+    def get_cli_options() -> t.List[click.Option]:
+        options = [
+            click.Option(
+                ["--batch-size"],
+                default=1000,
+                type=click.IntRange(1),
+                help="Number of records per insert",
+            ),
         ]
         return options
 
@@ -67,6 +95,7 @@ def get_base_dest_cmd():
     cmd_cls = BaseDestCmd(
         cmd_name=CMD_NAME,
         cli_config=MongoDBCliConfig,
-        write_config=WriteConfig,
+        additional_cli_options=[MongoDBCliWriteConfig],
+        write_config=MongoDBWriteConfig,
     )
     return cmd_cls
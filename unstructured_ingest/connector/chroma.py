@@ -124,19 +124,18 @@ class ChromaDestinationConnector(BaseDestinationConnector):
     def prepare_chroma_list(chunk: t.Tuple[t.Dict[str, t.Any]]) -> t.Dict[str, t.List[t.Any]]:
         """Helper function to break a tuple of dicts into list of parallel lists for ChromaDb.
         ({'id':1}, {'id':2}, {'id':3}) -> {'ids':[1,2,3]}"""
-        chroma_dict = {}
-        chroma_dict["ids"] = [x.get("id") for x in chunk]
-        chroma_dict["documents"] = [x.get("document") for x in chunk]
-        chroma_dict["embeddings"] = [x.get("embedding") for x in chunk]
-        chroma_dict["metadatas"] = [x.get("metadata") for x in chunk]
-        # Make sure all lists are of the same length
-        assert (
-            len(chroma_dict["ids"])
-            == len(chroma_dict["documents"])
-            == len(chroma_dict["embeddings"])
-            == len(chroma_dict["metadatas"])
-        )
-        return chroma_dict
+        ids, documents, embeddings, metadatas = [], [], [], []
+        for x in chunk:
+            ids.append(x["id"])
+            documents.append(x["document"])
+            embeddings.append(x["embedding"])
+            metadatas.append(x["metadata"])
+        return {
+            "ids": ids,
+            "documents": documents,
+            "embeddings": embeddings,
+            "metadatas": metadatas,
+        }
 
     def write_dict(self, *args, elements_dict: t.List[t.Dict[str, t.Any]], **kwargs) -> None:
         logger.info(f"Inserting / updating {len(elements_dict)} documents to destination ")
@@ -147,7 +146,9 @@ class ChromaDestinationConnector(BaseDestinationConnector):
             self.upsert_batch(self.prepare_chroma_list(chunk))
 
     def normalize_dict(self, element_dict: dict) -> dict:
-        element_id = element_dict.get("element_id", str(uuid.uuid4()))
+        element_id = (
+            element_dict["element_id"] if "element_id" in element_dict else str(uuid.uuid4())
+        )
         return {
             "id": element_id,
             "embedding": element_dict.pop("embeddings", None),
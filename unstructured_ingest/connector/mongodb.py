@@ -13,21 +13,28 @@ from unstructured_ingest.interfaces import (
     BaseConnectorConfig,
     BaseDestinationConnector,
     BaseIngestDocBatch,
+    BaseSessionHandle,
     BaseSingleIngestDoc,
     BaseSourceConnector,
+    ConfigSessionHandleMixin,
     IngestDocCleanupMixin,
+    IngestDocSessionHandleMixin,
     SourceConnectorCleanupMixin,
     SourceMetadata,
+    WriteConfig,
 )
 from unstructured_ingest.logger import logger
-from unstructured_ingest.utils.data_prep import flatten_dict
+from unstructured_ingest.utils.data_prep import batch_generator
 from unstructured_ingest.utils.dep_check import requires_dependencies
 
 if t.TYPE_CHECKING:
     from pymongo import MongoClient
+    from pymongo.cursor import Cursor
 
 
 SERVER_API_VERSION = "1"
+# Number of documents pulled per round trip while streaming a batch's documents
+DOCUMENT_CURSOR_BATCH_SIZE = 50
 
 
 def parse_userinfo(userinfo: str) -> t.Tuple[str, str]:
@@ -35,19 +42,56 @@ def parse_userinfo(userinfo: str) -> t.Tuple[str, str]:
     return user, passwd
 
 
+def concat_leaf_values(document: dict) -> bytes:
+    """Newline separated string values of all the (nested) leaf values of a document, in depth
+    first order. Walks the document iteratively and writes straight into a single buffer
+    rather than building a flattened copy of the document first."""
+    out = bytearray()
+    first = True
+    stack = [iter(document.values())]
+    while stack:
+        for value in stack[-1]:
+            if isinstance(value, dict):
+                stack.append(iter(value.values()))
+                break
+            if not first:
+                out += b"\n"
+            first = False
+            out += str(value).encode("utf8")
+        else:
+            stack.pop()
+    return bytes(out)
+
+
 @dataclass
 class MongoDBAccessConfig(AccessConfig):
     uri: t.Optional[str] = enhanced_field(sensitive=True, default=None)
 
 
 @dataclass
-class SimpleMongoDBConfig(BaseConnectorConfig):
+class MongoDBSessionHandle(BaseSessionHandle):
+    client: "MongoClient"
+
+
+@dataclass
+class SimpleMongoDBConfig(ConfigSessionHandleMixin, BaseConnectorConfig):
     access_config: MongoDBAccessConfig
     host: t.Optional[str] = None
     database: t.Optional[str] = None
     collection: t.Optional[str] = None
     port: int = 27017
     batch_size: int = 100
+    write_concern: t.Optional[int] = None
+    projection: t.Optional[t.Dict[str, t.Any]] = None
+
+    def __post_init__(self):
+        if self.projection is None:
+            return
+        if not isinstance(self.projection, dict):
+            raise ValueError("The MongoDB projection must be a json object.")
+        # Each document's _id is used for its filename and creation date
+        if not self.projection.get("_id", True):
+            raise ValueError("The MongoDB projection must not exclude the _id field.")
 
     @requires_dependencies(["pymongo"], extras="mongodb")
     def generate_client(self) -> "MongoClient":
@@ -55,19 +99,27 @@ class SimpleMongoDBConfig(BaseConnectorConfig):
         from pymongo.driver_info import DriverInfo
         from pymongo.server_api import ServerApi
 
+        # Only override the write concern when explicitly set, so any w option in the uri holds.
+        # w=0 skips waiting for acknowledgement, trading durability for write throughput.
+        client_kwargs = {} if self.write_concern is None else {"w": self.write_concern}
         if self.access_config.uri:
             return MongoClient(
                 self.access_config.uri,
                 server_api=ServerApi(version=SERVER_API_VERSION),
                 driver=DriverInfo(name="unstructured", version=unstructured_version),
+                **client_kwargs,
             )
         else:
             return MongoClient(
                 host=self.host,
                 port=self.port,
                 server_api=ServerApi(version=SERVER_API_VERSION),
+                **client_kwargs,
             )
 
+    def create_session_handle(self) -> MongoDBSessionHandle:
+        return MongoDBSessionHandle(client=self.generate_client())
+
     def get_collection(self, client):
         database = client[self.database]
         return database.get_collection(name=self.collection)
@@ -130,7 +182,7 @@ class MongoDBIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
 
 
 @dataclass
-class MongoDBIngestDocBatch(BaseIngestDocBatch):
+class MongoDBIngestDocBatch(IngestDocSessionHandleMixin, BaseIngestDocBatch):
     connector_config: SimpleMongoDBConfig
     ingest_docs: t.List[MongoDBIngestDoc] = field(default_factory=list)
     list_of_ids: t.List[str] = field(default_factory=list)
@@ -141,45 +193,46 @@ class MongoDBIngestDocBatch(BaseIngestDocBatch):
         return ",".join(sorted(self.list_of_ids))
 
     @requires_dependencies(["pymongo"], extras="mongodb")
-    def _get_docs(self) -> t.List[dict]:
-        """Fetches all documents in a collection."""
+    def _get_docs(self) -> "Cursor":
+        """Cursor over all documents in the batch's contiguous _id range."""
         from bson.objectid import ObjectId
 
-        # Note for future. Maybe this could use other client
-        client = self.connector_config.generate_client()
-        collection = self.connector_config.get_collection(client)
-        # MondoDB expects a list of ObjectIds
-        list_of_object_ids = []
-        for x in self.list_of_ids:
-            list_of_object_ids.append(ObjectId(x))
-        return list(collection.find({"_id": {"$in": list_of_object_ids}}))
+        # The session handle's client is shared across all batches handled by this process
+        collection = self.connector_config.get_collection(self.session_handle.client)
+        # Ids are listed in ascending order by the source connector, so the batch can be
+        # fetched with a bounded index scan rather than a large $in array
+        id_range = {
+            "$gte": ObjectId(self.list_of_ids[0]),
+            "$lte": ObjectId(self.list_of_ids[-1]),
+        }
+        # Streamed in small server side batches rather than loaded all at once
+        return collection.find(
+            {"_id": id_range}, projection=self.connector_config.projection
+        ).batch_size(DOCUMENT_CURSOR_BATCH_SIZE)
 
     def get_files(self):
-        documents = self._get_docs()
-        for doc in documents:
-            ingest_doc = MongoDBIngestDoc(
-                processor_config=self.processor_config,
-                read_config=self.read_config,
-                connector_config=self.connector_config,
-                document_meta=MongoDBDocumentMeta(
-                    collection=self.connector_config.collection,
-                    document_id=str(doc.get("_id")),
-                    date_created=doc.get("_id").generation_time.isoformat(),
-                ),
-                document=doc,
-            )
-            ingest_doc.update_source_metadata()
-            del doc["_id"]
-            filename = ingest_doc.filename
-            flattened_dict = flatten_dict(dictionary=doc)
-            str_values = [str(value) for value in flattened_dict.values()]
-            concatenated_values = "\n".join(str_values)
-
-            filename.parent.mkdir(parents=True, exist_ok=True)
-            with open(filename, "w", encoding="utf8") as f:
-                f.write(concatenated_values)
-
-            self.ingest_docs.append(ingest_doc)
+        # All documents in a batch land in the same collection directory, so it only
+        # needs to be created once rather than once per document
+        collection_dir = Path(self.read_config.download_dir) / self.connector_config.collection
+        collection_dir.mkdir(parents=True, exist_ok=True)
+        with self._get_docs() as documents:
+            for doc in documents:
+                ingest_doc = MongoDBIngestDoc(
+                    processor_config=self.processor_config,
+                    read_config=self.read_config,
+                    connector_config=self.connector_config,
+                    document_meta=MongoDBDocumentMeta(
+                        collection=self.connector_config.collection,
+                        document_id=str(doc.get("_id")),
+                        date_created=doc.get("_id").generation_time.isoformat(),
+                    ),
+                )
+                # The document itself isn't kept on the ingest doc, only one is held at a time
+                ingest_doc.update_source_metadata()
+                del doc["_id"]
+                ingest_doc.filename.write_bytes(concat_leaf_values(doc))
+
+                self.ingest_docs.append(ingest_doc)
 
 
 @dataclass
@@ -204,41 +257,43 @@ class MongoDBSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector):
         _ = self.client
 
     @requires_dependencies(["pymongo"], extras="mongodb")
-    def _get_doc_ids(self) -> t.List[str]:
-        """Fetches all document ids in a collection."""
+    def _get_doc_ids(self) -> t.Iterator[str]:
+        """Lazily yields all document ids in a collection, in ascending order, from a single
+        server-side cursor."""
         collection = self.connector_config.get_collection(self.client)
-        return [str(x) for x in collection.distinct("_id")]
+        cursor = (
+            collection.find({}, {"_id": 1})
+            .sort("_id", 1)
+            .batch_size(self.connector_config.batch_size)
+        )
+        for doc in cursor:
+            yield str(doc["_id"])
 
     def get_ingest_docs(self):
-        """Fetches all documents in an index, using ids that are fetched with _get_doc_ids"""
-        ids = self._get_doc_ids()
-        id_batches = [
-            ids[
-                i
-                * self.connector_config.batch_size : (i + 1)  # noqa
-                * self.connector_config.batch_size
-            ]
-            for i in range(
-                (len(ids) + self.connector_config.batch_size - 1)
-                // self.connector_config.batch_size
-            )
-        ]
-
-        return [
-            MongoDBIngestDocBatch(
+        """Fetches all documents in a collection, lazily emitting a batch each time enough ids
+        are read from _get_doc_ids"""
+        for batched_ids in batch_generator(
+            self._get_doc_ids(), batch_size=self.connector_config.batch_size
+        ):
+            yield MongoDBIngestDocBatch(
                 connector_config=self.connector_config,
                 processor_config=self.processor_config,
                 read_config=self.read_config,
-                list_of_ids=batched_ids,
+                list_of_ids=list(batched_ids),
             )
-            for batched_ids in id_batches
-        ]
+
+
+@dataclass
+class MongoDBWriteConfig(WriteConfig):
+    batch_size: int = 1000
 
 
 @dataclass
 class MongoDBDestinationConnector(BaseDestinationConnector):
+    write_config: MongoDBWriteConfig
     connector_config: SimpleMongoDBConfig
     _client: t.Optional["MongoClient"] = field(init=False, default=None)
+    _client_bulk_write: t.Optional[bool] = field(init=False, default=None)
 
     def to_dict(self, **kwargs):
         """
@@ -269,6 +324,18 @@ class MongoDBDestinationConnector(BaseDestinationConnector):
     def initialize(self):
         _ = self.client
 
+    @property
+    def client_bulk_write(self) -> bool:
+        """MongoClient.bulk_write, which encodes each document only once, is available from
+        pymongo 4.9 against MongoDB 8.0+ servers."""
+        if self._client_bulk_write is None:
+            from pymongo import version_tuple
+
+            self._client_bulk_write = version_tuple >= (4, 9) and tuple(
+                self.client.server_info()["versionArray"][:2]
+            ) >= (8, 0)
+        return self._client_bulk_write
+
     @requires_dependencies(["pymongo"], extras="mongodb")
     def write_dict(self, *args, elements_dict: t.List[t.Dict[str, t.Any]], **kwargs) -> None:
         logger.info(
@@ -279,7 +346,17 @@ class MongoDBDestinationConnector(BaseDestinationConnector):
 
         collection = self.connector_config.get_collection(self.client)
         try:
-            collection.insert_many(elements_dict)
+            for chunk in batch_generator(elements_dict, self.write_config.batch_size):
+                # Unordered inserts don't stall the rest of the chunk on a single slow write
+                if self.client_bulk_write:
+                    from pymongo import InsertOne
+
+                    self.client.bulk_write(
+                        [InsertOne(element, namespace=collection.full_name) for element in chunk],
+                        ordered=False,
+                    )
+                else:
+                    collection.insert_many(chunk, ordered=False)
         except Exception as e:
             logger.error(f"failed to write records: {e}", exc_info=True)
             raise WriteError(f"failed to write records: {e}")
@@ -2,6 +2,7 @@ import hashlib
 import os
 import typing as t
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from itertools import chain
 from pathlib import Path
@@ -11,9 +12,12 @@ from unstructured_ingest.error import SourceConnectionError, SourceConnectionNet
 from unstructured_ingest.interfaces import (
     AccessConfig,
     BaseConnectorConfig,
+    BaseSessionHandle,
     BaseSingleIngestDoc,
     BaseSourceConnector,
+    ConfigSessionHandleMixin,
     IngestDocCleanupMixin,
+    IngestDocSessionHandleMixin,
     SourceConnectorCleanupMixin,
     SourceMetadata,
 )
@@ -21,7 +25,9 @@ from unstructured_ingest.logger import logger
 from unstructured_ingest.utils.dep_check import requires_dependencies
 
 MAX_NUM_EMAILS = 1000000  # Maximum number of emails per folder
+MAX_NUM_WORKERS = 16  # Maximum number of concurrent folder requests
 if t.TYPE_CHECKING:
+    from msal import ConfidentialClientApplication
     from office365.graph_client import GraphClient
 
 
@@ -35,7 +41,12 @@ class OutlookAccessConfig(AccessConfig):
 
 
 @dataclass
-class SimpleOutlookConfig(BaseConnectorConfig):
+class OutlookSessionHandle(BaseSessionHandle):
+    service: "GraphClient"
+
+
+@dataclass
+class SimpleOutlookConfig(ConfigSessionHandleMixin, BaseConnectorConfig):
     """This class is getting the token."""
 
     access_config: OutlookAccessConfig
@@ -54,18 +65,25 @@ class SimpleOutlookConfig(BaseConnectorConfig):
                 "\nclient_id\nclient_cred\nuser_email",
             )
         self.token_factory = self._acquire_token
+        self._app: t.Optional["ConfidentialClientApplication"] = None
 
     @requires_dependencies(["msal"])
-    def _acquire_token(self):
+    def _get_app(self) -> "ConfidentialClientApplication":
+        """The app is only created once so that its in-memory token cache is reused,
+        rather than requesting a new token from the token endpoint every time."""
         from msal import ConfidentialClientApplication
 
-        try:
-            app = ConfidentialClientApplication(
+        if self._app is None:
+            self._app = ConfidentialClientApplication(
                 authority=f"{self.authority_url}/{self.tenant}",
                 client_id=self.client_id,
                 client_credential=self.access_config.client_credential,
             )
-            token = app.acquire_token_for_client(
+        return self._app
+
+    def _acquire_token(self):
+        try:
+            token = self._get_app().acquire_token_for_client(
                 scopes=["https://graph.microsoft.com/.default"],
             )
         except ValueError as exc:
@@ -79,9 +97,12 @@ class SimpleOutlookConfig(BaseConnectorConfig):
 
         return GraphClient(self.token_factory)
 
+    def create_session_handle(self) -> OutlookSessionHandle:
+        return OutlookSessionHandle(service=self._get_client())
+
 
 @dataclass
-class OutlookIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
+class OutlookIngestDoc(IngestDocSessionHandleMixin, IngestDocCleanupMixin, BaseSingleIngestDoc):
     connector_config: SimpleOutlookConfig
     message_id: str
     registry_name: str = "outlook"
@@ -91,28 +112,30 @@ class OutlookIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
 
     def hash_mail_name(self, id):
         """Outlook email ids are 152 char long. Hash to shorten to 16."""
-        return hashlib.sha256(id.encode("utf-8")).hexdigest()[:16]
+        # 8 digest bytes hex encode to the same 16 chars hexdigest()[:16] gave
+        return hashlib.sha256(id.encode("utf-8"), usedforsecurity=False).digest()[:8].hex()
 
     def _set_download_paths(self) -> None:
         """Creates paths for downloading and parsing."""
         download_path = Path(f"{self.read_config.download_dir}")
         output_path = Path(f"{self.processor_config.output_dir}")
 
+        # Hashed once here, every file name derived from the message id reuses it
+        self.hashed_message_id = self.hash_mail_name(self.message_id)
         self.download_dir = download_path
-        self.download_filepath = (
-            download_path / f"{self.hash_mail_name(self.message_id)}.eml"
-        ).resolve()
-        oname = f"{self.hash_mail_name(self.message_id)}.eml.json"
+        self.download_filepath = (download_path / f"{self.hashed_message_id}.eml").resolve()
+        oname = f"{self.hashed_message_id}.eml.json"
         self.output_dir = output_path
         self.output_filepath = (output_path / oname).resolve()
 
+    # Both paths are resolved once when they are set, no need to resolve them on every access
     @property
     def filename(self):
-        return Path(self.download_filepath).resolve()
+        return self.download_filepath
 
     @property
     def _output_filename(self):
-        return Path(self.output_filepath).resolve()
+        return self.output_filepath
 
     @property
     def record_locator(self) -> t.Optional[t.Dict[str, t.Any]]:
@@ -122,12 +145,12 @@ class OutlookIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
         }
 
     @requires_dependencies(["office365"], extras="outlook")
-    def update_source_metadata(self, **kwargs):
+    def _fetch_message(self):
         from office365.runtime.client_request_exception import ClientRequestException
 
         try:
-            client = self.connector_config._get_client()
-            msg = (
+            client = self.session_handle.service
+            return (
                 client.users[self.connector_config.user_email]
                 .messages[self.message_id]
                 .get()
@@ -135,11 +158,17 @@ class OutlookIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
             )
         except ClientRequestException as e:
             if e.response.status_code == 404:
-                self.source_metadata = SourceMetadata(
-                    exists=False,
-                )
-                return
+                return None
             raise
+
+    def update_source_metadata(self, **kwargs):
+        # The message can be passed in when it was already fetched, e.g. while listing a folder
+        msg = kwargs["message"] if "message" in kwargs else self._fetch_message()
+        if msg is None:
+            self.source_metadata = SourceMetadata(
+                exists=False,
+            )
+            return
         self.source_metadata = SourceMetadata(
             date_created=msg.created_datetime.isoformat(),
             date_modified=msg.last_modified_datetime.isoformat(),
@@ -150,7 +179,7 @@ class OutlookIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
 
     @SourceConnectionNetworkError.wrap
     def _run_download(self, local_file):
-        client = self.connector_config._get_client()
+        client = self.session_handle.service
         client.users[self.connector_config.user_email].messages[self.message_id].download(
             local_file,
         ).execute_query()
@@ -161,8 +190,9 @@ class OutlookIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
     def get_file(self):
         """Relies on Office365 python sdk message object to do the download."""
         try:
-            self.connector_config._get_client()
-            self.update_source_metadata()
+            # Metadata is usually already set from the folder listing by the source connector
+            if self._source_metadata is None:
+                self.update_source_metadata()
             if not self.download_dir.is_dir():
                 logger.debug(f"Creating directory: {self.download_dir}")
                 self.download_dir.mkdir(parents=True, exist_ok=True)
@@ -170,7 +200,7 @@ class OutlookIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
             with open(
                 os.path.join(
                     self.download_dir,
-                    self.hash_mail_name(self.message_id) + ".eml",
+                    self.hashed_message_id + ".eml",
                 ),
                 "wb",
             ) as local_file:
@@ -178,11 +208,11 @@ class OutlookIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
 
         except Exception as e:
             logger.error(
-                f"Error while downloading and saving file: {self.hash_mail_name(self.message_id)}.",
+                f"Error while downloading and saving file: {self.hashed_message_id}.",
             )
             logger.error(e)
             return
-        logger.info(f"File downloaded: {self.hash_mail_name(self.message_id)}")
+        logger.info(f"File downloaded: {self.hashed_message_id}")
         return
 
 
@@ -210,21 +240,32 @@ class OutlookSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector):
             logger.error(f"failed to validate connection: {e}", exc_info=True)
             raise SourceConnectionError(f"failed to validate connection: {e}")
 
-    def recurse_folders(self, folder_id, main_folder_dict):
-        """We only get a count of subfolders for any folder.
-        Have to make additional calls to get subfolder ids."""
-        subfolders = (
-            self.client.users[self.connector_config.user_email]
+    def _get_child_folders(self, folder_id: str):
+        # GraphClient queues pending queries on the client itself, so each worker thread
+        # needs its own client rather than sharing self.client
+        client = self.connector_config._get_client()
+        return (
+            client.users[self.connector_config.user_email]
             .mail_folders[folder_id]
             .child_folders.get()
             .execute_query()
         )
-        for subfolder in subfolders:
-            for k, v in main_folder_dict.items():
-                if subfolder.get_property("parentFolderId") in v:
-                    v.append(subfolder.id)
-            if subfolder.get_property("childFolderCount") > 0:
-                self.recurse_folders(subfolder.id, main_folder_dict)
+
+    def recurse_folders(self, folder_ids: t.List[str], main_folder_dict):
+        """We only get a count of subfolders for any folder.
+        Have to make additional calls to get subfolder ids. Folders are walked one level at
+        a time, fetching the children of every folder in a level concurrently."""
+        with ThreadPoolExecutor(max_workers=MAX_NUM_WORKERS) as executor:
+            while folder_ids:
+                next_folder_ids = []
+                for subfolders in executor.map(self._get_child_folders, folder_ids):
+                    for subfolder in subfolders:
+                        for k, v in main_folder_dict.items():
+                            if subfolder.get_property("parentFolderId") in v:
+                                v.append(subfolder.id)
+                        if subfolder.get_property("childFolderCount") > 0:
+                            next_folder_ids.append(subfolder.id)
+                folder_ids = next_folder_ids
 
     def get_folder_ids(self):
         """Sets the mail folder ids and subfolder ids for requested root mail folders."""
@@ -239,17 +280,13 @@ class OutlookSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector):
             if folder.get_property("childFolderCount") > 0:
                 root_folders_with_subfolders.append(folder.id)
 
-        for folder in root_folders_with_subfolders:
-            self.recurse_folders(folder, self.root_folders)
+        self.recurse_folders(root_folders_with_subfolders, self.root_folders)
 
         # Narrow down all mail folder ids (plus all subfolders) to the ones that were requested.
+        requested_folders = frozenset(x.lower() for x in self.connector_config.outlook_folders)
         self.selected_folder_ids = list(
             chain.from_iterable(
-                [
-                    v
-                    for k, v in self.root_folders.items()
-                    if k.lower() in [x.lower() for x in self.connector_config.outlook_folders]
-                ],
+                [v for k, v in self.root_folders.items() if k.lower() in requested_folders],
             ),
         )
         if not self.selected_folder_ids:
@@ -258,28 +295,38 @@ class OutlookSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector):
                 f"{self.connector_config.outlook_folders}",
             )
 
+    def _get_folder_messages(self, folder_id: str):
+        # A client per call, see _get_child_folders
+        client = self.connector_config._get_client()
+        return (
+            client.users[self.connector_config.user_email]
+            .mail_folders[folder_id]
+            .messages.get()
+            .top(MAX_NUM_EMAILS)  # Prevents the return from paging
+            .execute_query()
+        )
+
     def get_ingest_docs(self):
         """Returns a list of all the message objects that are in the requested root folder(s)."""
         filtered_messages = []
 
-        # Get all the relevant messages in the selected folders/subfolders.
-        for folder_id in self.selected_folder_ids:
-            messages = (
-                self.client.users[self.connector_config.user_email]
-                .mail_folders[folder_id]
-                .messages.get()
-                .top(MAX_NUM_EMAILS)  # Prevents the return from paging
-                .execute_query()
-            )
-            # Skip empty list if there are no messages in folder.
-            if messages:
-                filtered_messages.append(messages)
-        return [
-            OutlookIngestDoc(
+        # Get all the relevant messages in the selected folders/subfolders, each folder is
+        # fetched concurrently since the requests are independent of each other.
+        with ThreadPoolExecutor(max_workers=MAX_NUM_WORKERS) as executor:
+            for messages in executor.map(self._get_folder_messages, self.selected_folder_ids):
+                # Skip empty list if there are no messages in folder.
+                if messages:
+                    filtered_messages.append(messages)
+        ingest_docs = []
+        for message in chain.from_iterable(filtered_messages):
+            ingest_doc = OutlookIngestDoc(
                 connector_config=self.connector_config,
                 processor_config=self.processor_config,
                 read_config=self.read_config,
                 message_id=message.id,
             )
-            for message in list(chain.from_iterable(filtered_messages))
-        ]
+            # The listed messages already carry every property the source metadata needs,
+            # so set it here rather than fetching each message again while downloading
+            ingest_doc.update_source_metadata(message=message)
+            ingest_docs.append(ingest_doc)
+        return ingest_docs
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import functools
 import json
 from dataclasses import InitVar, fields
-from typing import Any, Callable, Optional, Type, TypeVar, Union
+from typing import Any, Callable, Optional, Type, TypeVar, Union, get_type_hints
 
 import dataclasses_json.core as dataclasses_json_core
 from dataclasses_json import DataClassJsonMixin
@@ -31,6 +32,11 @@ def custom_decode_dataclass(cls, kvs, infer_missing):
 
 dataclasses_json_core._decode_dataclass = custom_decode_dataclass
 
+# Monkey-patch get_type_hints, used by _decode_dataclass to resolve the field types of a class.
+# Resolving them means evaluating every annotation of the class and its bases on every
+# from_dict call, caching the result per class means that only happens once.
+dataclasses_json_core.get_type_hints = functools.lru_cache(maxsize=None)(get_type_hints)
+
 
 class EnhancedDataClassJsonMixin(DataClassJsonMixin):
     """A mixin class extending DataClassJsonMixin.
@@ -3,6 +3,7 @@ through Unstructured."""
 
 from __future__ import annotations
 
+import copy
 import functools
 import json
 import os
@@ -300,6 +301,17 @@ class SourceMetadata(EnhancedDataClassJsonMixin, ABC):
     permissions_data: Optional[list[dict[str, Any]]] = None
 
 
+def _drop_session_handle(doc: Any) -> Any:
+    """Session handles hold process-local resources such as clients, which can break deepcopy
+    with errors like: TypeError: cannot pickle '_thread.lock' object
+    Returns a shallow copy without the handle, it is reassigned per process when deserialized."""
+    if getattr(doc, "_session_handle", None) is None:
+        return doc
+    doc_cp = copy.copy(doc)
+    setattr(doc_cp, "_session_handle", None)
+    return doc_cp
+
+
 class IngestDocJsonMixin(EnhancedDataClassJsonMixin):
     """
     Inherently, DataClassJsonMixin does not add in any @property fields to the json/dict
@@ -335,7 +347,7 @@ class IngestDocJsonMixin(EnhancedDataClassJsonMixin):
             as_dict[prop] = val
 
     def to_dict(self, **kwargs) -> dict[str, Json]:
-        as_dict = _asdict(self, **kwargs)
+        as_dict = _asdict(_drop_session_handle(self), **kwargs)
         if "_session_handle" in as_dict:
             as_dict.pop("_session_handle", None)
         self.add_props(as_dict=as_dict, props=self.properties_to_serialize)
@@ -376,7 +388,8 @@ class BatchIngestDocJsonMixin(EnhancedDataClassJsonMixin):
             as_dict[prop] = val
 
     def to_dict(self, encode_json=False) -> dict[str, Json]:
-        as_dict = _asdict(self, encode_json=encode_json)
+        as_dict = _asdict(_drop_session_handle(self), encode_json=encode_json)
+        as_dict.pop("_session_handle", None)
         self.add_props(as_dict=as_dict, props=self.properties_to_serialize)
         return as_dict
 
@@ -18,7 +18,7 @@ class AirtableRunner(Runner):
     def update_read_config(self):
         hashed_dir_name = hashlib.sha256(
             self.connector_config.access_config.personal_access_token.encode("utf-8"),
-        )
+        ).hexdigest()
 
         self.read_config.download_dir = update_download_dir_hash(
             connector_name="airtable",
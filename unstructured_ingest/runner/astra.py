@@ -18,7 +18,7 @@ class AstraRunner(Runner):
     def update_read_config(self):
         hashed_dir_name = hashlib.sha256(
             str(self.connector_config.access_config.api_endpoint).encode("utf-8"),
-        )
+        ).hexdigest()
         self.read_config.download_dir = update_download_dir_hash(
             connector_name="astra",
             read_config=self.read_config,
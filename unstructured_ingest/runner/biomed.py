@@ -28,7 +28,7 @@ class BiomedRunner(Runner):
 
         hashed_dir_name = hashlib.sha256(
             base_path.encode("utf-8"),
-        )
+        ).hexdigest()
 
         self.read_config.download_dir = update_download_dir_hash(
             connector_name="biomed",
@@ -18,7 +18,7 @@ class DeltaTableRunner(Runner):
     def update_read_config(self):
         hashed_dir_name = hashlib.sha256(
             str(self.connector_config.table_uri).encode("utf-8"),
-        )
+        ).hexdigest()
         self.read_config.download_dir = update_download_dir_hash(
             connector_name="delta_table",
             read_config=self.read_config,
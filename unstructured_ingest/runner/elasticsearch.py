@@ -23,7 +23,7 @@ class ElasticSearchRunner(Runner):
             ).encode(
                 "utf-8",
             ),
-        )
+        ).hexdigest()
 
         self.read_config.download_dir = update_download_dir_hash(
             connector_name="elasticsearch",
@@ -20,7 +20,7 @@ class GitlabRunner(Runner):
             f"{self.connector_config.url}_{self.connector_config.branch}".encode(
                 "utf-8",
             ),
-        )
+        ).hexdigest()
 
         self.read_config.download_dir = update_download_dir_hash(
             connector_name="gitlab",
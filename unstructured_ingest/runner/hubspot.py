@@ -18,7 +18,7 @@ class HubSpotRunner(Runner):
     def update_read_config(self):
         hashed_dir_name = hashlib.sha256(
             self.connector_config.access_config.api_token.encode("utf-8"),
-        )
+        ).hexdigest()
 
         self.read_config.download_dir = update_download_dir_hash(
             connector_name="hubspot",
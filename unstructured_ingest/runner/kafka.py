@@ -18,7 +18,7 @@ class KafkaRunner(Runner):
     def update_read_config(self):
         hashed_dir_name = hashlib.sha256(
             str(self.connector_config.bootstrap_server).encode("utf-8"),
-        )
+        ).hexdigest()
         self.read_config.download_dir = update_download_dir_hash(
             connector_name="kafka",
             read_config=self.read_config,
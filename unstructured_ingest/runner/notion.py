@@ -25,15 +25,15 @@ class NotionRunner(Runner):
                     ",".join(self.connector_config.page_ids),
                     ",".join(self.connector_config.database_ids),
                 ).encode("utf-8"),
-            )
+            ).hexdigest()
         elif self.connector_config.page_ids:
             hashed_dir_name = hashlib.sha256(
                 ",".join(self.connector_config.page_ids).encode("utf-8"),
-            )
+            ).hexdigest()
         elif self.connector_config.database_ids:
             hashed_dir_name = hashlib.sha256(
                 ",".join(self.connector_config.database_ids).encode("utf-8"),
-            )
+            ).hexdigest()
         else:
             raise ValueError("could not create local cache directory name")
 
@@ -16,7 +16,9 @@ class OutlookRunner(Runner):
     connector_config: "SimpleOutlookConfig"
 
     def update_read_config(self):
-        hashed_dir_name = hashlib.sha256(self.connector_config.user_email.encode("utf-8"))
+        hashed_dir_name = hashlib.sha256(
+            self.connector_config.user_email.encode("utf-8"),
+        ).hexdigest()
 
         self.read_config.download_dir = update_download_dir_hash(
             connector_name="outlook",
@@ -16,7 +16,7 @@ class SalesforceRunner(Runner):
     connector_config: "SimpleSalesforceConfig"
 
     def update_read_config(self):
-        hashed_dir_name = hashlib.sha256(self.connector_config.username.encode("utf-8"))
+        hashed_dir_name = hashlib.sha256(self.connector_config.username.encode("utf-8")).hexdigest()
 
         self.read_config.download_dir = update_download_dir_hash(
             connector_name="salesforce",
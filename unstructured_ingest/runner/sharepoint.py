@@ -18,7 +18,7 @@ class SharePointRunner(Runner):
     def update_read_config(self):
         hashed_dir_name = hashlib.sha256(
             f"{self.connector_config.site}_{self.connector_config.path}".encode("utf-8"),
-        )
+        ).hexdigest()
 
         self.read_config.download_dir = update_download_dir_hash(
             connector_name="sharepoint",
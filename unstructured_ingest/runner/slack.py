@@ -16,7 +16,7 @@ class SlackRunner(Runner):
     def update_read_config(self):
         hashed_dir_name = hashlib.sha256(
             ",".join(self.connector_config.channels).encode("utf-8"),
-        )
+        ).hexdigest()
 
         self.read_config.download_dir = update_download_dir_hash(
             connector_name="slack",
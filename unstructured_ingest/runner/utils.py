@@ -15,7 +15,7 @@ def update_download_dir_remote_url(
     remote_url: str,
     logger: logging.Logger,
 ) -> str:
-    hashed_dir_name = hashlib.sha256(remote_url.encode("utf-8"))
+    hashed_dir_name = hashlib.sha256(remote_url.encode("utf-8")).hexdigest()
     return update_download_dir_hash(
         connector_name=connector_name,
         read_config=read_config,
@@ -27,14 +27,14 @@ def update_download_dir_remote_url(
 def update_download_dir_hash(
     connector_name: str,
     read_config: ReadConfig,
-    hashed_dir_name: hashlib._Hash,
+    hashed_dir_name: str,
     logger: logging.Logger,
 ) -> str:
     if not read_config.download_dir:
         cache_path = Path.home() / ".cache" / "unstructured" / "ingest"
         if not cache_path.exists():
             cache_path.mkdir(parents=True, exist_ok=True)
-        download_dir = cache_path / connector_name / hashed_dir_name.hexdigest()[:10]
+        download_dir = cache_path / connector_name / hashed_dir_name[:10]
         if read_config.preserve_downloads:
             logger.warning(
                 f"Preserving downloaded files but download_dir is not specified,"
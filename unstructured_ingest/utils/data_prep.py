@@ -48,40 +48,60 @@ def flatten_dict(
     well. If remove_none is True, then None keys/values are removed from the flattened
     dictionary.
     """
-    keys_to_omit = keys_to_omit if keys_to_omit else []
+    keys_to_omit = frozenset(keys_to_omit) if keys_to_omit else frozenset()
     flattened_dict: dict[str, Any] = {}
     for key, value in dictionary.items():
         new_key = f"{parent_key}{separator}{key}" if parent_key else key
-        if new_key in keys_to_omit:
-            flattened_dict[new_key] = value
-        elif value is None and remove_none:
-            continue
-        elif isinstance(value, dict):
-            value = cast("dict[str, Any]", value)
-            flattened_dict.update(
-                flatten_dict(
-                    value, new_key, separator, flatten_lists, remove_none, keys_to_omit=keys_to_omit
-                ),
-            )
-        elif isinstance(value, (list, tuple)) and flatten_lists:
-            value = cast("list[Any] | tuple[Any]", value)
-            for index, item in enumerate(value):
-                flattened_dict.update(
-                    flatten_dict(
-                        {f"{new_key}{separator}{index}": item},
-                        "",
-                        separator,
-                        flatten_lists,
-                        remove_none,
-                        keys_to_omit=keys_to_omit,
-                    )
-                )
-        else:
-            flattened_dict[new_key] = value
-
+        _flatten_value(
+            flattened_dict, new_key, value, separator, flatten_lists, remove_none, keys_to_omit
+        )
     return flattened_dict
 
 
+def _flatten_value(
+    flattened_dict: dict[str, Any],
+    key: str,
+    value: Any,
+    separator: str,
+    flatten_lists: bool,
+    remove_none: bool,
+    keys_to_omit: frozenset,
+) -> None:
+    """Adds the flattened value under key to flattened_dict. Nested values are written straight
+    into the one output dict instead of into intermediate dicts that are merged back up."""
+    if key in keys_to_omit:
+        flattened_dict[key] = value
+    elif value is None and remove_none:
+        return
+    elif isinstance(value, dict):
+        value = cast("dict[str, Any]", value)
+        for child_key, child_value in value.items():
+            new_key = f"{key}{separator}{child_key}" if key else child_key
+            _flatten_value(
+                flattened_dict,
+                new_key,
+                child_value,
+                separator,
+                flatten_lists,
+                remove_none,
+                keys_to_omit,
+            )
+    elif isinstance(value, (list, tuple)) and flatten_lists:
+        value = cast("list[Any] | tuple[Any]", value)
+        for index, item in enumerate(value):
+            _flatten_value(
+                flattened_dict,
+                f"{key}{separator}{index}",
+                item,
+                separator,
+                flatten_lists,
+                remove_none,
+                keys_to_omit,
+            )
+    else:
+        flattened_dict[key] = value
+
+
 def validate_date_args(date: Optional[str] = None) -> bool:
     """Validate whether the provided date string satisfies any of the supported date formats.
 
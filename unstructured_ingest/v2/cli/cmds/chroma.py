@@ -85,10 +85,32 @@ class ChromaCliUploaderConfig(CliConfig):
         options = [
             click.Option(
                 ["--batch-size"],
-                default=100,
-                type=int,
-                help="Number of records per batch",
-            )
+                default=None,
+                type=click.IntRange(1),
+                help="Number of records per batch, sized from the embedding dimension "
+                "if not set",
+            ),
+            click.Option(
+                ["--num-threads"],
+                default=4,
+                type=click.IntRange(1),
+                help="Number of batches to upsert concurrently",
+            ),
+            click.Option(
+                ["--embedding-precision"],
+                default=None,
+                type=click.IntRange(0),
+                help="Round embedding values to this many decimal places before upserting, "
+                "trading precision for smaller requests",
+            ),
+            click.Option(
+                ["--bulk-ingest"],
+                is_flag=True,
+                default=False,
+                help="When writing to a local path, relax sqlite durability while uploading "
+                "to speed up large loads. Writes from an interrupted upload may be lost or "
+                "leave the database corrupted.",
+            ),
         ]
         return options
 
@@ -42,7 +42,14 @@ class MongoDBCliUploaderConfig(CliConfig):
                 default=100,
                 type=int,
                 help="Number of records per batch",
-            )
+            ),
+            click.Option(
+                ["--async-client"],
+                is_flag=True,
+                default=False,
+                help="Upload files concurrently with an async MongoDB client, "
+                "requires pymongo>=4.9 or motor",
+            ),
         ]
         return options
 
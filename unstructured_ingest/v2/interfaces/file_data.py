@@ -6,6 +6,12 @@ from typing import Any, Literal, Optional
 from dataclasses_json import DataClassJsonMixin
 from unstructured.documents.elements import DataSourceMetadata
 
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup, fall back on the standard library
+    orjson = None
+
 
 @dataclass
 class SourceIdentifiers:
@@ -40,15 +46,24 @@ class FileData(DataClassJsonMixin):
     @classmethod
     def from_file(cls, path: str) -> "FileData":
         path = Path(path).resolve()
-        if not path.exists() or not path.is_file():
+        if not path.is_file():
             raise ValueError(f"file path not valid: {path}")
-        with open(str(path.resolve()), "rb") as f:
-            file_data_dict = json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        file_data_dict = orjson.loads(raw) if orjson else json.loads(raw)
         file_data = FileData.from_dict(file_data_dict)
         return file_data
 
     def to_file(self, path: str) -> None:
         path = Path(path).resolve()
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(str(path.resolve()), "w") as f:
+        if orjson:
+            with open(path, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        self.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    )
+                )
+            return
+        with open(path, "w") as f:
             json.dump(self.to_dict(), f, indent=2)
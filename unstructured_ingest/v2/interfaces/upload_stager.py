@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import Any, Optional, TypeVar
 
 from unstructured_ingest.enhanced_dataclass import EnhancedDataClassJsonMixin
 from unstructured_ingest.v2.interfaces.file_data import FileData
@@ -20,6 +20,11 @@ UploadStagerConfigT = TypeVar("UploadStagerConfigT", bound=UploadStagerConfig)
 class UploadStager(BaseProcess, ABC):
     upload_stager_config: UploadStagerConfigT
 
+    def get_output_path(self, output_dir: Path, output_filename: str) -> Optional[Path]:
+        # Stagers that know where run will write their output can return it here, letting
+        # output that is newer than its elements file be reused instead of staged again
+        return None
+
     @abstractmethod
     def run(
         self,
@@ -37,3 +37,7 @@ class Uploader(BaseProcess, BaseConnector, ABC):
 
     async def run_async(self, path: Path, file_data: FileData, **kwargs: Any) -> None:
         return self.run(contents=[UploadContent(path=path, file_data=file_data)], **kwargs)
+
+    async def close_async(self) -> None:
+        # Called on the same event loop once all run_async calls of an upload have finished
+        pass
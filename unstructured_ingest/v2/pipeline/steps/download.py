@@ -92,8 +92,7 @@ class DownloadStep(PipelineStep):
             file_data.metadata.filesize_bytes = file_size_bytes
         if changed:
             logger.debug(f"Updating file data with new content: {file_data.to_dict()}")
-            with file_data_path.open("w") as file:
-                json.dump(file_data.to_dict(), file, indent=2)
+            file_data.to_file(path=str(file_data_path))
 
     async def _run_async(self, fn: Callable, file_data_path: str) -> list[DownloadStepResponse]:
         file_data = FileData.from_file(path=file_data_path)
@@ -174,9 +173,7 @@ class DownloadStep(PipelineStep):
         record_hash = self.get_hash(extras=[file_data.identifier])
         filename = f"{record_hash}.json"
         filepath = (self.cache_dir / filename).resolve()
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(str(filepath), "w") as f:
-            json.dump(file_data.to_dict(), f, indent=2)
+        file_data.to_file(path=str(filepath))
         return str(filepath)
 
     def get_hash(self, extras: Optional[list[str]]) -> str:
@@ -44,9 +44,7 @@ class IndexStep(PipelineStep):
                 record_hash = self.get_hash(extras=[file_data.identifier])
                 filename = f"{record_hash}.json"
                 filepath = (self.cache_dir / filename).resolve()
-                filepath.parent.mkdir(parents=True, exist_ok=True)
-                with open(str(filepath), "w") as f:
-                    json.dump(file_data.to_dict(), f, indent=2)
+                file_data.to_file(path=str(filepath))
                 yield str(filepath)
             except Exception as e:
                 logger.error(f"failed to create index for file data: {file_data}", exc_info=True)
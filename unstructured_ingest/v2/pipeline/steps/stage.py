@@ -36,15 +36,35 @@ class UploadStageStep(PipelineStep):
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Created {self.identifier} with configs: {config}")
 
+    def should_stage(
+        self, elements_filepath: Path, output_path: Optional[Path], file_data: FileData
+    ) -> bool:
+        if self.context.reprocess or file_data.reprocess or output_path is None:
+            return True
+        try:
+            return output_path.stat().st_mtime < elements_filepath.stat().st_mtime
+        except FileNotFoundError:
+            return True
+
     async def _run_async(
         self, fn: Callable, path: str, file_data_path: str
     ) -> UploadStageStepResponse:
         path = Path(path)
+        file_data = FileData.from_file(path=file_data_path)
+        output_filename = self.get_hash(extras=[path.name])
+        output_path = self.process.get_output_path(
+            output_dir=self.cache_dir, output_filename=output_filename
+        )
+        if not self.should_stage(
+            elements_filepath=path, output_path=output_path, file_data=file_data
+        ):
+            logger.debug(f"Skipping staging, output already up to date: {output_path}")
+            return UploadStageStepResponse(file_data_path=file_data_path, path=str(output_path))
         fn_kwargs = {
             "elements_filepath": path,
-            "file_data": FileData.from_file(path=file_data_path),
+            "file_data": file_data,
             "output_dir": self.cache_dir,
-            "output_filename": self.get_hash(extras=[path.name]),
+            "output_filename": output_filename,
         }
         if not asyncio.iscoroutinefunction(fn):
             staged_output_path = fn(**fn_kwargs)
@@ -54,6 +54,12 @@ class UploadStep(PipelineStep):
         else:
             self.process_whole(iterable=iterable)
 
+    async def _process_async(self, iterable: iterable_input):
+        try:
+            return await super()._process_async(iterable=iterable)
+        finally:
+            await self.process.close_async()
+
     def _run(self, fn: Callable, contents: list[UploadStepContent]):
         upload_contents = [
             UploadContent(path=Path(c["path"]), file_data=FileData.from_file(c["file_data_path"]))
@@ -1,10 +1,14 @@
+import asyncio
 import json
 import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import date, datetime
+from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional
 
+import numpy as np
 from dateutil import parser
 
 from unstructured_ingest.enhanced_dataclass import enhanced_field
@@ -26,10 +30,41 @@ from unstructured_ingest.v2.processes.connector_registry import (
     DestinationRegistryEntry,
 )
 
+try:
+    import orjson
+except ImportError:
+    # orjson is installed along with chromadb, fall back on the standard library without it
+    orjson = None
+
 if TYPE_CHECKING:
     from chromadb import Client
+    from chromadb.api import AsyncClientAPI
+    from chromadb.api.models.AsyncCollection import AsyncCollection
 
 CONNECTOR_TYPE = "chroma"
+# Write buffer for staged output, large enough that the many small per element writes are
+# flushed to the file in a handful of syscalls
+STAGED_WRITE_BUFFER_SIZE = 1024 * 1024
+# Used to size upsert batches from the embedding dimension when no batch size is given
+DEFAULT_BATCH_SIZE = 100
+TARGET_BATCH_EMBEDDING_BYTES = 8_000_000
+# Applied to the sqlite connections of a persistent client when bulk ingesting, trading
+# durability of the in progress writes for fewer fsyncs
+BULK_INGEST_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous = OFF",
+    "PRAGMA journal_mode = MEMORY",
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+def _json_loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _json_dumps(data: Any) -> bytes:
+    if orjson:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf8")
 
 
 @dataclass
@@ -76,14 +111,34 @@ class ChromaUploadStager(UploadStager):
         """
         Prepares dictionary in the format that Chroma requires
         """
-        element_id = data.get("element_id", str(uuid.uuid4()))
+        element_id = data["element_id"] if "element_id" in data else str(uuid.uuid4())
+        # Split out the embedding and text in a single pass over the element. None values are
+        # dropped from the metadata either way, so they're skipped here already.
+        embedding = document = None
+        metadata = {}
+        nested = False
+        for key, value in data.items():
+            if key == "embeddings":
+                embedding = value
+            elif key == "text":
+                document = value
+            elif value is not None:
+                metadata[key] = value
+                nested = nested or isinstance(value, (dict, list, tuple))
+        if nested:
+            metadata = flatten_dict(metadata, separator="-", flatten_lists=True, remove_none=True)
         return {
             "id": element_id,
-            "embedding": data.pop("embeddings", None),
-            "document": data.pop("text", None),
-            "metadata": flatten_dict(data, separator="-", flatten_lists=True, remove_none=True),
+            "embedding": embedding,
+            "document": document,
+            "metadata": metadata,
         }
 
+    def get_output_path(self, output_dir: Path, output_filename: str) -> Path:
+        # Staging is fully determined by the elements file, so the pipeline can reuse output
+        # written after the elements file last changed
+        return Path(output_dir) / Path(f"{output_filename}.json")
+
     def run(
         self,
         elements_filepath: Path,
@@ -92,18 +147,35 @@ class ChromaUploadStager(UploadStager):
         output_filename: str,
         **kwargs: Any,
     ) -> Path:
-        with open(elements_filepath) as elements_file:
-            elements_contents = json.load(elements_file)
-        conformed_elements = [self.conform_dict(data=element) for element in elements_contents]
-        output_path = Path(output_dir) / Path(f"{output_filename}.json")
-        with open(output_path, "w") as output_file:
-            json.dump(conformed_elements, output_file)
+        with open(elements_filepath, "rb") as elements_file:
+            elements_contents = _json_loads(elements_file.read())
+        # Conform and write out one element at a time rather than building a second list of
+        # all the conformed elements before dumping it. The output is written to a temporary
+        # file and moved into place so an interrupted run never leaves a partial file behind
+        # that would look up to date.
+        output_path = self.get_output_path(output_dir=output_dir, output_filename=output_filename)
+        tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+        try:
+            with open(tmp_path, "wb", buffering=STAGED_WRITE_BUFFER_SIZE) as output_file:
+                output_file.write(b"[")
+                for i, element in enumerate(elements_contents):
+                    if i:
+                        output_file.write(b",")
+                    output_file.write(_json_dumps(self.conform_dict(data=element)))
+                output_file.write(b"]")
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        tmp_path.replace(output_path)
         return output_path
 
 
 @dataclass
 class ChromaUploaderConfig(UploaderConfig):
-    batch_size: int = 100
+    batch_size: Optional[int] = None
+    num_threads: int = 4
+    embedding_precision: Optional[int] = None
+    bulk_ingest: bool = False
 
 
 @dataclass
@@ -111,10 +183,13 @@ class ChromaUploader(Uploader):
     connector_type: str = CONNECTOR_TYPE
     upload_config: ChromaUploaderConfig
     connection_config: ChromaConnectionConfig
+    _client: Optional["Client"] = field(init=False, default=None)
+    _async_client: Optional["AsyncClientAPI"] = field(init=False, default=None)
+    _async_collection: Optional["asyncio.Future[AsyncCollection]"] = field(init=False, default=None)
 
     def precheck(self) -> None:
         try:
-            self.create_client()
+            self.get_client()
         except Exception as e:
             logger.error(f"failed to validate connection: {e}", exc_info=True)
             raise DestinationConnectionError(f"failed to validate connection: {e}")
@@ -144,6 +219,39 @@ class ChromaUploader(Uploader):
         else:
             raise ValueError("Chroma connector requires either path or host and port to be set.")
 
+    def get_client(self) -> "Client":
+        """The client made for precheck is reused by run, rather than opening the persistent
+        database or http connection pool a second time."""
+        if self._client is None:
+            self._client = self.create_client()
+        return self._client
+
+    @property
+    def use_async_client(self) -> bool:
+        """create_client only builds an http client when no path is set"""
+        return not self.connection_config.path and bool(
+            self.connection_config.host and self.connection_config.port
+        )
+
+    def is_async(self) -> bool:
+        # Http upserts mostly wait on the server, an async client keeps several requests
+        # going without a thread for each
+        return self.use_async_client
+
+    @requires_dependencies(["chromadb"], extras="chroma")
+    async def create_async_client(self) -> "AsyncClientAPI":
+        import chromadb
+
+        return await chromadb.AsyncHttpClient(
+            host=self.connection_config.host,
+            port=self.connection_config.port,
+            ssl=self.connection_config.ssl,
+            headers=self.connection_config.access_config.headers,
+            settings=self.connection_config.access_config.settings,
+            tenant=self.connection_config.tenant,
+            database=self.connection_config.database,
+        )
+
     @DestinationConnectionError.wrap
     def upsert_batch(self, collection, batch):
 
@@ -159,42 +267,176 @@ class ChromaUploader(Uploader):
         except Exception as e:
             raise ValueError(f"chroma error: {e}") from e
 
+    async def upsert_batch_async(self, collection, batch):
+        try:
+            await collection.upsert(
+                ids=batch["ids"],
+                documents=batch["documents"],
+                embeddings=batch["embeddings"],
+                metadatas=batch["metadatas"],
+            )
+        except Exception as e:
+            raise DestinationConnectionError(f"chroma error: {e}") from e
+
     @staticmethod
     def prepare_chroma_list(chunk: tuple[dict[str, Any]]) -> dict[str, list[Any]]:
         """Helper function to break a tuple of dicts into list of parallel lists for ChromaDb.
         ({'id':1}, {'id':2}, {'id':3}) -> {'ids':[1,2,3]}"""
-        chroma_dict = {}
-        chroma_dict["ids"] = [x.get("id") for x in chunk]
-        chroma_dict["documents"] = [x.get("document") for x in chunk]
-        chroma_dict["embeddings"] = [x.get("embedding") for x in chunk]
-        chroma_dict["metadatas"] = [x.get("metadata") for x in chunk]
-        # Make sure all lists are of the same length
-        assert (
-            len(chroma_dict["ids"])
-            == len(chroma_dict["documents"])
-            == len(chroma_dict["embeddings"])
-            == len(chroma_dict["metadatas"])
-        )
-        return chroma_dict
+        # Embeddings stay as parsed lists, chromadb would tolist() a numpy array anyway
+        ids, documents, embeddings, metadatas = [], [], [], []
+        for x in chunk:
+            ids.append(x["id"])
+            documents.append(x["document"])
+            embeddings.append(x["embedding"])
+            metadatas.append(x["metadata"])
+        return {
+            "ids": ids,
+            "documents": documents,
+            "embeddings": embeddings,
+            "metadatas": metadatas,
+        }
 
-    def run(self, contents: list[UploadContent], **kwargs: Any) -> None:
+    def prepare_batch(self, chunk: tuple[dict[str, Any]]) -> dict[str, list[Any]]:
+        batch = self.prepare_chroma_list(chunk)
+        precision = self.upload_config.embedding_precision
+        if precision is not None and all(e is not None for e in batch["embeddings"]):
+            # Embeddings are sent as json numbers, fewer digits make for a smaller request
+            batch["embeddings"] = np.round(np.asarray(batch["embeddings"]), precision).tolist()
+        return batch
+
+    @staticmethod
+    def _read_elements(path: Path) -> list[dict[str, Any]]:
+        with open(path, "rb") as elements_file:
+            return _json_loads(elements_file.read())
 
-        elements_dict = []
+    def _iter_elements(self, contents: list[UploadContent]) -> Iterator[dict[str, Any]]:
+        """Yields the staged elements one file at a time, rather than loading every file's
+        elements into memory before uploading any of them."""
         for content in contents:
-            with open(content.path) as elements_file:
-                elements = json.load(elements_file)
-                elements_dict.extend(elements)
+            yield from self._read_elements(content.path)
+
+    def get_batch_size(self, element: dict[str, Any]) -> int:
+        """Unless set, the batch size is picked so that each batch carries about
+        TARGET_BATCH_EMBEDDING_BYTES of float32 embeddings, based on the first element's."""
+        if self.upload_config.batch_size:
+            return self.upload_config.batch_size
+        dimension = len(element.get("embedding") or [])
+        if not dimension:
+            return DEFAULT_BATCH_SIZE
+        return max(8, min(2048, TARGET_BATCH_EMBEDDING_BYTES // (dimension * 4)))
+
+    def _iter_batches(self, elements: Iterator[dict[str, Any]]) -> Iterator[tuple[dict[str, Any]]]:
+        first_element = next(elements, None)
+        if first_element is None:
+            return
+        batch_size = self.get_batch_size(first_element)
+        logger.debug(f"upserting to chroma in batches of {batch_size}")
+        yield from batch_generator(chain([first_element], elements), batch_size)
+
+    @staticmethod
+    def _get_bulk_ingest_initializer(client: "Client") -> Callable[[], None]:
+        # The persistent client keeps one sqlite connection per thread, so the pragmas are set
+        # from each upload thread on its own connection. Those connections are discarded along
+        # with the threads, leaving the connection of the calling thread untouched.
+        try:
+            pool = client._server._sysdb._conn_pool
+        except AttributeError as e:
+            raise DestinationConnectionError(
+                f"bulk ingest is not supported with this version of chromadb: {e}"
+            ) from e
+
+        def relax_sqlite_durability() -> None:
+            conn = pool.connect()
+            try:
+                for pragma in BULK_INGEST_SQLITE_PRAGMAS:
+                    conn.execute(pragma)
+            finally:
+                pool.return_to_pool(conn)
+
+        return relax_sqlite_durability
+
+    def _upload(self, contents: list[UploadContent]) -> None:
+        client = self.get_client()
 
+        collection = client.get_or_create_collection(name=self.connection_config.collection_name)
+        # Each upsert blocks on a network or sqlite write, so overlap several of them. The number
+        # of batches in flight is capped to keep the staged elements from piling up in memory.
+        max_in_flight = 2 * self.upload_config.num_threads
+        initializer = None
+        if self.upload_config.bulk_ingest and self.connection_config.path:
+            initializer = self._get_bulk_ingest_initializer(client)
+        with ThreadPoolExecutor(
+            max_workers=self.upload_config.num_threads, initializer=initializer
+        ) as executor:
+            futures = set()
+            for chunk in self._iter_batches(self._iter_elements(contents)):
+                if len(futures) >= max_in_flight:
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                futures.add(
+                    executor.submit(self.upsert_batch, collection, self.prepare_batch(chunk))
+                )
+            for future in wait(futures).done:
+                future.result()
+
+    def run(self, contents: list[UploadContent], **kwargs: Any) -> None:
         logger.info(
-            f"writing {len(elements_dict)} objects to destination "
+            f"writing objects from {len(contents)} files to destination "
             f"collection {self.connection_config.collection_name} "
             f"at {self.connection_config.host}",
         )
-        client = self.create_client()
+        self._upload(contents=contents)
 
-        collection = client.get_or_create_collection(name=self.connection_config.collection_name)
-        for chunk in batch_generator(elements_dict, self.upload_config.batch_size):
-            self.upsert_batch(collection, self.prepare_chroma_list(chunk))
+    async def _create_async_collection(self) -> "AsyncCollection":
+        self._async_client = await self.create_async_client()
+        return await self._async_client.get_or_create_collection(
+            name=self.connection_config.collection_name
+        )
+
+    def get_async_collection(self) -> "asyncio.Future[AsyncCollection]":
+        # Files uploaded concurrently all wait on the same future, so the client and collection
+        # are only set up once per upload
+        if self._async_collection is None:
+            self._async_collection = asyncio.ensure_future(self._create_async_collection())
+        return self._async_collection
+
+    async def run_async(self, path: Path, file_data: FileData, **kwargs: Any) -> None:
+        loop = asyncio.get_running_loop()
+        elements = await loop.run_in_executor(None, self._read_elements, path)
+        logger.info(
+            f"writing {len(elements)} objects from {path} to destination "
+            f"collection {self.connection_config.collection_name} "
+            f"at {self.connection_config.host}",
+        )
+        collection = await self.get_async_collection()
+        # Same cap on in flight batches as the threaded upload, as concurrent requests
+        tasks = set()
+        for chunk in self._iter_batches(iter(elements)):
+            if len(tasks) >= self.upload_config.num_threads:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+            tasks.add(
+                asyncio.ensure_future(
+                    self.upsert_batch_async(collection, self.prepare_batch(chunk))
+                )
+            )
+        if tasks:
+            done, _ = await asyncio.wait(tasks)
+            for task in done:
+                task.result()
+
+    async def close_async(self) -> None:
+        if self._async_collection is not None and not self._async_collection.done():
+            self._async_collection.cancel()
+        self._async_collection = None
+        client, self._async_client = self._async_client, None
+        # chromadb's async client has no close of its own, its http api releases the underlying
+        # httpx clients when exited as an async context manager
+        server = getattr(client, "_server", None)
+        if hasattr(server, "__aexit__"):
+            await server.__aexit__(None, None, None)
 
 
 chroma_destination_entry = DestinationRegistryEntry(
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from time import time
 from typing import TYPE_CHECKING, Any, Generator, Optional, TypeVar
@@ -258,16 +260,12 @@ class FsspecDownloader(Downloader):
             raise SourceConnectionNetworkError(f"failed to download file {file_data.identifier}")
         return self.generate_download_response(file_data=file_data, download_path=download_path)
 
-    async def async_run(self, file_data: FileData, **kwargs: Any) -> DownloadResponse:
-        download_path = self.get_download_path(file_data=file_data)
-        download_path.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            rpath = file_data.additional_metadata["original_file_path"]
-            await self.fs.get(rpath=rpath, lpath=download_path.as_posix())
-        except Exception as e:
-            logger.error(f"failed to download file {file_data.identifier}: {e}", exc_info=True)
-            raise SourceConnectionNetworkError(f"failed to download file {file_data.identifier}")
-        return self.generate_download_response(file_data=file_data, download_path=download_path)
+    async def run_async(self, file_data: FileData, **kwargs: Any) -> DownloadResponse:
+        # fs.get blocks until the whole file is written, isolate it in the default executor so
+        # the event loop keeps the other files' downloads going concurrently. Async filesystems
+        # are safe to share across threads, their calls all go through fsspec's own io loop.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.run, file_data=file_data, **kwargs))
 
 
 @dataclass
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Generator, Optional, Union
 
@@ -26,6 +27,12 @@ from unstructured_ingest.v2.processes.connectors.fsspec.fsspec import (
 CONNECTOR_TYPE = "gcs"
 
 
+@lru_cache(maxsize=32)
+def _parse_service_account_key(service_account_key: str) -> Union[str, dict]:
+    """Access configs are rebuilt for every file, parse each distinct key only once."""
+    return json_to_dict(service_account_key)
+
+
 @dataclass
 class GcsIndexerConfig(FsspecIndexerConfig):
     pass
@@ -49,14 +56,20 @@ class GcsAccessConfig(FsspecAccessConfig):
             return
 
         # Case: token as json
-        if isinstance(json_to_dict(self.service_account_key), dict):
-            self.token = json_to_dict(self.service_account_key)
+        parsed_key = _parse_service_account_key(self.service_account_key)
+        if isinstance(parsed_key, dict):
+            # Copied so the cached value can't be changed through this config
+            self.token = dict(parsed_key)
             return
 
         # Case: path to token
-        if Path(self.service_account_key).is_file():
-            self.token = self.service_account_key
-            return
+        try:
+            if Path(self.service_account_key).is_file():
+                self.token = self.service_account_key
+                return
+        except OSError:
+            # not a valid path
+            pass
 
         raise ValueError("Invalid auth token value")
 
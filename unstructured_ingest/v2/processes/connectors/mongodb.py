@@ -1,3 +1,5 @@
+import asyncio
+import inspect
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -8,7 +10,7 @@ from unstructured.__version__ import __version__ as unstructured_version
 from unstructured_ingest.enhanced_dataclass import enhanced_field
 from unstructured_ingest.error import DestinationConnectionError
 from unstructured_ingest.utils.data_prep import batch_generator
-from unstructured_ingest.utils.dep_check import requires_dependencies
+from unstructured_ingest.utils.dep_check import dependency_exists, requires_dependencies
 from unstructured_ingest.v2.interfaces import (
     AccessConfig,
     ConnectionConfig,
@@ -25,7 +27,7 @@ from unstructured_ingest.v2.processes.connector_registry import (
 )
 
 if TYPE_CHECKING:
-    from pymongo import MongoClient
+    from pymongo import AsyncMongoClient, MongoClient
 
 CONNECTOR_TYPE = "mongodb"
 SERVER_API_VERSION = "1"
@@ -80,6 +82,7 @@ class MongoDBUploadStager(UploadStager):
 @dataclass
 class MongoDBUploaderConfig(UploaderConfig):
     batch_size: int = 100
+    async_client: bool = False
 
 
 @dataclass
@@ -87,8 +90,12 @@ class MongoDBUploader(Uploader):
     upload_config: MongoDBUploaderConfig
     connection_config: MongoDBConnectionConfig
     connector_type: str = CONNECTOR_TYPE
+    _async_client: Optional["AsyncMongoClient"] = field(init=False, default=None)
 
     def precheck(self) -> None:
+        if self.is_async():
+            # Fail before uploading anything if there is no async client to upload with
+            self._get_async_client_cls()
         try:
             client = self.create_client()
             client.admin.command("ping")
@@ -96,31 +103,70 @@ class MongoDBUploader(Uploader):
             logger.error(f"failed to validate connection: {e}", exc_info=True)
             raise DestinationConnectionError(f"failed to validate connection: {e}")
 
-    @requires_dependencies(["pymongo"], extras="mongodb")
-    def create_client(self) -> "MongoClient":
-        from pymongo import MongoClient
+    def is_async(self) -> bool:
+        return self.upload_config.async_client
+
+    def _create_client(self, client_cls: type) -> Any:
         from pymongo.driver_info import DriverInfo
         from pymongo.server_api import ServerApi
 
         if self.connection_config.access_config.uri:
-            return MongoClient(
+            return client_cls(
                 self.connection_config.access_config.uri,
                 server_api=ServerApi(version=SERVER_API_VERSION),
                 driver=DriverInfo(name="unstructured", version=unstructured_version),
             )
         else:
-            return MongoClient(
+            return client_cls(
                 host=self.connection_config.host,
                 port=self.connection_config.port,
                 server_api=ServerApi(version=SERVER_API_VERSION),
             )
 
+    @requires_dependencies(["pymongo"], extras="mongodb")
+    def create_client(self) -> "MongoClient":
+        from pymongo import MongoClient
+
+        return self._create_client(client_cls=MongoClient)
+
+    @requires_dependencies(["pymongo"], extras="mongodb")
+    def _get_async_client_cls(self) -> type:
+        try:
+            from pymongo import AsyncMongoClient
+        except ImportError:
+            # pymongo only ships an async client from 4.9 onwards, fall back on motor
+            if not dependency_exists("motor"):
+                raise ImportError(
+                    "Uploading with an async client requires pymongo>=4.9 or motor. "
+                    'Please install them using `pip install "unstructured-ingest[mongodb]"`.'
+                )
+            from motor.motor_asyncio import AsyncIOMotorClient as AsyncMongoClient
+
+        return AsyncMongoClient
+
+    def create_async_client(self) -> "AsyncMongoClient":
+        return self._create_client(client_cls=self._get_async_client_cls())
+
+    def get_async_client(self) -> "AsyncMongoClient":
+        # Created on first use from within the event loop running the upload and shared by all
+        # of its files, so the connection pool and handshakes aren't redone for every file
+        if self._async_client is None:
+            self._async_client = self.create_async_client()
+        return self._async_client
+
+    async def close_async(self) -> None:
+        if self._async_client is None:
+            return
+        client, self._async_client = self._async_client, None
+        # AsyncMongoClient.close is a coroutine, motor's client closes synchronously
+        closed = client.close()
+        if inspect.isawaitable(closed):
+            await closed
+
     def run(self, contents: list[UploadContent], **kwargs: Any) -> None:
         elements_dict = []
         for content in contents:
-            with open(content.path) as elements_file:
-                elements = json.load(elements_file)
-                elements_dict.extend(elements)
+            elements_dict.extend(self._read_elements(content.path))
 
         logger.info(
             f"writing {len(elements_dict)} objects to destination "
@@ -132,7 +178,31 @@ class MongoDBUploader(Uploader):
         db = client[self.connection_config.database]
         collection = db[self.connection_config.collection]
         for chunk in batch_generator(elements_dict, self.upload_config.batch_size):
-            collection.insert_many(chunk)
+            collection.insert_many(chunk, ordered=False)
+
+    @staticmethod
+    def _read_elements(path: Path) -> list[dict[str, Any]]:
+        with open(path) as elements_file:
+            return json.load(elements_file)
+
+    async def run_async(self, path: Path, file_data: FileData, **kwargs: Any) -> None:
+        # Read off the event loop so the other files' inserts keep going meanwhile
+        loop = asyncio.get_running_loop()
+        elements_dict = await loop.run_in_executor(None, self._read_elements, path)
+
+        logger.info(
+            f"writing {len(elements_dict)} objects to destination "
+            f"db, {self.connection_config.database}, "
+            f"collection {self.connection_config.collection} "
+            f"at {self.connection_config.host}",
+        )
+        client = self.get_async_client()
+        db = client[self.connection_config.database]
+        collection = db[self.connection_config.collection]
+        for chunk in batch_generator(elements_dict, self.upload_config.batch_size):
+            # Unordered inserts let the server apply the batch without stopping at
+            # the first failure, multiple files are uploaded concurrently on the event loop
+            await collection.insert_many(chunk, ordered=False)
 
 
 mongodb_destination_entry = DestinationRegistryEntry(